@@ -8,14 +8,28 @@ The Catzilla v0.2.0 Memory Revolution provides 30-35% memory efficiency gains.
 
 import asyncio
 import functools
+import logging
 import os
-import signal
 import sys
 import threading
 import time
-from typing import Any, Callable, Dict, List, Optional, Union
+from collections import deque
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Union,
+)
 from urllib.parse import parse_qs
 
+_log = logging.getLogger("catzilla.app")
+
 
 def _safe_print(message: str):
     """Print message with Windows console encoding safety"""
@@ -60,20 +74,58 @@ from .hybrid_executor import ExecutionError, ExecutorConfig, HybridExecutor
 from .integration import DIMiddleware, DIRouteEnhancer
 from .middleware import ZeroAllocMiddleware
 from .router import CAcceleratedRouter
-from .types import HTMLResponse, JSONResponse, Request, Response, RouteHandler
+from .types import JSONResponse, Request, Response, RouteHandler
 
 # Import logging system for beautiful startup banners and dev logging
 from .ui import BannerRenderer, DevLogger, ProductionLogger, ServerInfoCollector
 
+# Help text for jemalloc static-TLS import failures, keyed by platform.system()
+_TLS_HELP_HEADER = "\n====== JEMALLOC TLS ALLOCATION ERROR ======\n"
+_TLS_HELP_FOOTER = "For detailed help: https://github.com/rezwanahmedsami/catzilla/blob/main/docs/jemalloc_troubleshooting.md"
+_TLS_HELP = {
+    "Linux": (
+        _TLS_HELP_HEADER
+        + "This error occurs when jemalloc is loaded after other libraries have consumed TLS space.\n\n"
+        "To fix on Ubuntu/Debian:\n"
+        "  export LD_PRELOAD=/lib/x86_64-linux-gnu/libjemalloc.so.2:$LD_PRELOAD\n\n"
+        "To fix on RHEL/CentOS/Fedora:\n"
+        "  export LD_PRELOAD=/usr/lib64/libjemalloc.so.2:$LD_PRELOAD\n\n"
+        "For CI environments, add this line before running tests or applications.\n"
+        + _TLS_HELP_FOOTER
+    ),
+    "Darwin": (
+        _TLS_HELP_HEADER + "To fix on macOS:\n"
+        "  # For Intel Macs\n"
+        "  export DYLD_INSERT_LIBRARIES=/usr/local/lib/libjemalloc.dylib:$DYLD_INSERT_LIBRARIES\n\n"
+        "  # For Apple Silicon Macs\n"
+        "  export DYLD_INSERT_LIBRARIES=/opt/homebrew/lib/libjemalloc.dylib:$DYLD_INSERT_LIBRARIES\n\n"
+        + _TLS_HELP_FOOTER
+    ),
+    "Windows": (
+        _TLS_HELP_HEADER + "To fix on Windows:\n"
+        "  1. Install jemalloc via vcpkg:\n"
+        "     vcpkg install jemalloc:x64-windows\n\n"
+        "  2. Set environment variable:\n"
+        "     set CATZILLA_JEMALLOC_PATH=C:\\vcpkg\\installed\\x64-windows\\bin\\jemalloc.dll\n\n"
+        "  3. Or run: scripts\\jemalloc_helper.bat\n\n" + _TLS_HELP_FOOTER
+    ),
+}
+_TLS_HELP_DEFAULT = (
+    _TLS_HELP_HEADER
+    + "This error requires preloading jemalloc before other libraries.\n"
+    "See our documentation at docs/jemalloc_troubleshooting.md for platform-specific instructions.\n"
+    + _TLS_HELP_FOOTER
+)
+
 try:
+    from catzilla._catzilla import JEMALLOC_USES_PREFIX
     from catzilla._catzilla import Server as _Server
-    from catzilla._catzilla import (  # New runtime allocator functions
+    from catzilla._catzilla import (
         get_current_allocator,
         get_memory_stats,
         has_jemalloc,
         init_memory_system,
         init_memory_with_allocator,
-        jemalloc_available,
         send_response,
         set_allocator,
     )
@@ -81,46 +133,9 @@ except ImportError as e:
     # Check if this is a jemalloc TLS error
     if "cannot allocate memory in static TLS block" in str(e):
         # Provide a helpful error message for jemalloc TLS issues
-        import os
         import platform
 
-        system = platform.system()
-        error_msg = "\n====== JEMALLOC TLS ALLOCATION ERROR ======\n"
-
-        if system == "Linux":
-            error_msg += (
-                "This error occurs when jemalloc is loaded after other libraries have consumed TLS space.\n\n"
-                "To fix on Ubuntu/Debian:\n"
-                "  export LD_PRELOAD=/lib/x86_64-linux-gnu/libjemalloc.so.2:$LD_PRELOAD\n\n"
-                "To fix on RHEL/CentOS/Fedora:\n"
-                "  export LD_PRELOAD=/usr/lib64/libjemalloc.so.2:$LD_PRELOAD\n\n"
-                "For CI environments, add this line before running tests or applications.\n"
-            )
-        elif system == "Darwin":  # macOS
-            error_msg += (
-                "To fix on macOS:\n"
-                "  # For Intel Macs\n"
-                "  export DYLD_INSERT_LIBRARIES=/usr/local/lib/libjemalloc.dylib:$DYLD_INSERT_LIBRARIES\n\n"
-                "  # For Apple Silicon Macs\n"
-                "  export DYLD_INSERT_LIBRARIES=/opt/homebrew/lib/libjemalloc.dylib:$DYLD_INSERT_LIBRARIES\n\n"
-            )
-        elif system == "Windows":
-            error_msg += (
-                "To fix on Windows:\n"
-                "  1. Install jemalloc via vcpkg:\n"
-                "     vcpkg install jemalloc:x64-windows\n\n"
-                "  2. Set environment variable:\n"
-                "     set CATZILLA_JEMALLOC_PATH=C:\\vcpkg\\installed\\x64-windows\\bin\\jemalloc.dll\n\n"
-                "  3. Or run: scripts\\jemalloc_helper.bat\n\n"
-            )
-        else:
-            error_msg += (
-                "This error requires preloading jemalloc before other libraries.\n"
-                "See our documentation at docs/jemalloc_troubleshooting.md for platform-specific instructions.\n"
-            )
-
-        error_msg += "For detailed help: https://github.com/rezwanahmedsami/catzilla/blob/main/docs/jemalloc_troubleshooting.md"
-        raise ImportError(error_msg) from e
+        raise ImportError(_TLS_HELP.get(platform.system(), _TLS_HELP_DEFAULT)) from e
     else:
         # General import error
         raise ImportError(
@@ -129,6 +144,129 @@ except ImportError as e:
         ) from e
 
 
+# jemalloc support is fixed at build time, so ask the extension only once
+_HAS_JEMALLOC: bool = has_jemalloc()
+
+# jemalloc defaults: background purging threads, THP-backed metadata, and 30s
+# dirty/muzzy page decay, plus per-CPU arenas (instead of 4 x ncpu) on Linux,
+# the only platform where jemalloc supports percpu_arena
+_DEFAULT_MALLOC_CONF = (
+    ("percpu_arena:percpu," if sys.platform.startswith("linux") else "")
+    + "background_thread:true,metadata_thp:auto,"
+    "dirty_decay_ms:30000,muzzy_decay_ms:30000"
+)
+# jemalloc only reads the variable matching its symbol prefix, which the build
+# detects (the bundled and most distro builds are unprefixed)
+_MALLOC_CONF_ENV = "JE_MALLOC_CONF" if JEMALLOC_USES_PREFIX else "MALLOC_CONF"
+
+# Number of memory profiling samples kept for trend calculations
+_MEMORY_HISTORY_SIZE = 100
+
+# Request body media types handlers accept; anything else gets a 415
+_ALLOWED_CONTENT_TYPES = frozenset(
+    {
+        "application/json",
+        "application/x-www-form-urlencoded",
+        "text/plain",
+        "multipart/form-data",
+    }
+)
+
+
+def _warn_post_route_failure(name: str, error: Exception) -> None:
+    print(f"Warning: Post-route middleware '{name}' failed: {error}")
+
+
+def _compile_pre_route_dispatch(chain: tuple) -> Callable:
+    """Generate one straight-line function for the global pre-route chain
+
+    Each middleware becomes an inline call with its skip_paths check and
+    sync/async handling resolved at generation time. Returns the first
+    non-None result, or None when every middleware passes.
+    """
+    namespace = {"_run_async": asyncio.run}
+    lines = ["def _pre_route_dispatch(request, base_path):"]
+    for index, middleware_info in enumerate(chain):
+        namespace[f"_mw{index}"] = middleware_info["handler"]
+        call = f"_mw{index}(request)"
+        if middleware_info["is_async"]:
+            call = f"_run_async({call})"
+        indent = "    "
+        if middleware_info["skip_paths"]:
+            namespace[f"_skip{index}"] = middleware_info["skip_paths"]
+            lines.append(f"    if base_path not in _skip{index}:")
+            indent = "        "
+        lines.append(f"{indent}result = {call}")
+        lines.append(f"{indent}if result is not None:")
+        lines.append(f"{indent}    return result")
+    lines.append("    return None")
+
+    exec(compile("\n".join(lines), "<catzilla-pre-route>", "exec"), namespace)
+    return namespace["_pre_route_dispatch"]
+
+
+def _compile_post_route_dispatch(
+    chain: tuple, on_error: Optional[Callable[[str, Exception], None]]
+) -> Callable:
+    """Generate one straight-line function for the global post-route chain
+
+    Each middleware runs in its own try block so a failure is reported via
+    on_error (or silently ignored when None) without breaking the response.
+    Returns the response, replaced by any Response a middleware returned.
+    """
+    namespace = {"_run_async": asyncio.run, "_Response": Response}
+    lines = ["def _post_route_dispatch(request, response, base_path):"]
+    for index, middleware_info in enumerate(chain):
+        namespace[f"_mw{index}"] = middleware_info["handler"]
+        # Post-route middleware gets both request and response; legacy
+        # single-argument middleware gets only the request
+        if middleware_info["accepts_response"]:
+            call = f"_mw{index}(request, response)"
+        else:
+            call = f"_mw{index}(request)"
+        if middleware_info["is_async"]:
+            call = f"_run_async({call})"
+        indent = "    "
+        if middleware_info["skip_paths"]:
+            namespace[f"_skip{index}"] = middleware_info["skip_paths"]
+            lines.append(f"    if base_path not in _skip{index}:")
+            indent = "        "
+        lines.append(f"{indent}try:")
+        lines.append(f"{indent}    result = {call}")
+        lines.append(f"{indent}    if isinstance(result, _Response):")
+        lines.append(f"{indent}        response = result")
+        lines.append(f"{indent}except Exception as error:")
+        if on_error is None:
+            lines.append(f"{indent}    pass")
+        else:
+            namespace["_on_error"] = on_error
+            namespace[f"_name{index}"] = middleware_info.get("name", "unknown")
+            lines.append(f"{indent}    _on_error(_name{index}, error)")
+    lines.append("    return response")
+
+    exec(compile("\n".join(lines), "<catzilla-post-route>", "exec"), namespace)
+    return namespace["_post_route_dispatch"]
+
+
+def _identity(handler: RouteHandler) -> RouteHandler:
+    """Return the handler unchanged (auto-validation disabled)"""
+    return handler
+
+
+class _PrerenderedResponse(JSONResponse):
+    """Fixed production error response, formatted once and reused per request"""
+
+    __slots__ = ("_rendered",)
+
+    def __init__(self, status_code: int, message: str):
+        super().__init__({"error": message}, status_code=status_code)
+        self._rendered = self._render()
+
+    def send(self, client):
+        """Send the pre-formatted headers and body in a single C call"""
+        send_response(client, self.status_code, *self._rendered)
+
+
 class Catzilla:
     """The Python Framework That BREAKS THE RULES
 
@@ -150,11 +288,7 @@ class Catzilla:
             This is a static method that can be called before creating a Catzilla instance
             to check jemalloc availability. Useful for conditional initialization logic.
         """
-        try:
-            return jemalloc_available()
-        except (ImportError, NameError):
-            # C extension not available or function not found
-            return False
+        return _HAS_JEMALLOC
 
     @staticmethod
     def get_available_allocators() -> list:
@@ -164,11 +298,8 @@ class Catzilla:
             List of allocator names that are available in this build
         """
         allocators = ["malloc"]  # malloc is always available
-        try:
-            if jemalloc_available():
-                allocators.append("jemalloc")
-        except (ImportError, NameError):
-            pass
+        if _HAS_JEMALLOC:
+            allocators.append("jemalloc")
         return allocators
 
     def __init__(
@@ -178,6 +309,7 @@ class Catzilla:
         memory_profiling: bool = False,
         auto_memory_tuning: bool = True,
         memory_stats_interval: int = 60,
+        extra_malloc_conf: str = "",
         auto_validation: bool = True,
         enable_di: bool = True,
         di_container: Optional[DIContainer] = None,
@@ -199,6 +331,8 @@ class Catzilla:
             memory_profiling: Enable real-time memory monitoring and optimization
             auto_memory_tuning: Enable adaptive memory management and arena optimization
             memory_stats_interval: Interval in seconds for automatic memory stats collection
+            extra_malloc_conf: Additional jemalloc options (MALLOC_CONF syntax, e.g.
+                         "narenas:4,hpa:true") appended after Catzilla's defaults
             auto_validation: Enable FastAPI-style automatic validation (20x faster)
             enable_di: Enable revolutionary dependency injection system (5-8x faster DI)
             di_container: Custom DI container (creates new one if None)
@@ -214,6 +348,13 @@ class Catzilla:
             Catzilla will automatically fall back to the standard malloc allocator
             without error, ensuring maximum compatibility across different deployments.
 
+            With jemalloc, Catzilla exports background purging threads, transparent
+            huge pages for metadata and (on Linux) per-CPU arenas through
+            MALLOC_CONF (JE_MALLOC_CONF for a je_-prefixed jemalloc build), keeping
+            any value already in the environment. jemalloc reads these options only once,
+            when it initializes, so they have no effect if it is already active in
+            the process (e.g. loaded via LD_PRELOAD).
+
             Dependency injection provides C-speed service resolution with FastAPI-style
             decorators and seamless integration with the existing validation system.
 
@@ -230,7 +371,23 @@ class Catzilla:
         self.memory_profiling = memory_profiling
         self.auto_memory_tuning = auto_memory_tuning
         self.memory_stats_interval = memory_stats_interval
+        self.extra_malloc_conf = extra_malloc_conf
+        # Production error bodies never vary, so build them once up front
+        self._error_responses: Dict[tuple, Response] = {}
+        if production:
+            for code, message in (
+                (404, "Not found"),
+                (405, "Method not allowed"),
+                (500, "Internal server error"),
+            ):
+                self._error_responses[code, message] = _PrerenderedResponse(
+                    code, message
+                )
         self.auto_validation = auto_validation
+        # Handler wrapper picked once so route registration doesn't re-branch
+        self._wrap_handler: Callable[[RouteHandler], RouteHandler] = (
+            create_auto_validated_handler if auto_validation else _identity
+        )
 
         # Logging configuration
         self.show_banner = show_banner
@@ -275,15 +432,21 @@ class Catzilla:
         # Initialize Zero-Allocation Middleware System
         self.middleware_system = None  # Will be initialized after app is complete
         self._registered_middlewares = []
+        # Priority-sorted chains, rebuilt on registration rather than per request
+        self._pre_route_chain: tuple = ()
+        self._post_route_chain: tuple = ()
+        # Straight-line functions generated from the chains above
+        self._pre_route_dispatch: Callable = _compile_pre_route_dispatch(())
+        self._post_route_dispatch: Callable = _compile_post_route_dispatch((), None)
 
         # Initialize Revolutionary Background Task System
         self.tasks: Optional[BackgroundTasks] = None
         self._task_system_enabled = False
 
         # Memory profiling state (initialize before memory revolution)
-        self._memory_stats_history: List[dict] = []
-        self._last_memory_check = 0.0
+        self._memory_stats_history: Deque[dict] = deque(maxlen=_MEMORY_HISTORY_SIZE)
         self._memory_optimization_active = False
+        self._profile_stop = threading.Event()
 
         # Initialize the memory revolution with advanced options
         self._init_memory_revolution()
@@ -328,11 +491,12 @@ class Catzilla:
         """Initialize the jemalloc memory revolution with advanced options"""
         try:
             # Check if jemalloc is available at runtime (from conditional compilation)
-            jemalloc_runtime_available = jemalloc_available()
+            jemalloc_runtime_available = _HAS_JEMALLOC
 
             if self.use_jemalloc and jemalloc_runtime_available:
                 # Set allocator to jemalloc before initialization
                 try:
+                    self._configure_jemalloc()
                     set_allocator("jemalloc")
                     # Initialize memory system with jemalloc
                     # Initialize memory system quietly (no console output)
@@ -348,8 +512,11 @@ class Catzilla:
                         self._start_memory_profiling()
 
                 except RuntimeError as e:
-                    _safe_print(f"⚠️  Catzilla: Failed to initialize with jemalloc: {e}")
-                    _safe_print("⚠️  Catzilla: Falling back to standard memory system")
+                    _log.warning(
+                        "Failed to initialize with jemalloc (%s); "
+                        "falling back to standard memory system",
+                        e,
+                    )
                     self.has_jemalloc = False
                     self.use_jemalloc = False
                     # Fallback to malloc quietly
@@ -357,8 +524,8 @@ class Catzilla:
                     init_memory_system(1)  # 1 = quiet mode
 
             elif self.use_jemalloc and not jemalloc_runtime_available:
-                _safe_print(
-                    "⚠️  Catzilla: jemalloc requested but not available - falling back to standard memory"
+                _log.warning(
+                    "jemalloc requested but not available - falling back to standard memory"
                 )
                 self.has_jemalloc = False
                 self.use_jemalloc = False  # Disable since not available
@@ -367,16 +534,14 @@ class Catzilla:
                 init_memory_system(1)  # 1 = quiet mode
 
             else:
-                _safe_print(
-                    "⚡ Catzilla: Running with standard memory system (jemalloc disabled)"
-                )
+                _log.info("Running with standard memory system (jemalloc disabled)")
                 self.has_jemalloc = False
                 # Use standard malloc quietly
                 set_allocator("malloc")
                 init_memory_system(1)  # 1 = quiet mode
 
         except Exception as e:
-            _safe_print(f"⚠️  Catzilla: Memory system initialization warning: {e}")
+            _log.warning("Memory system initialization warning: %s", e)
             self.has_jemalloc = False
             self.use_jemalloc = False
             # Emergency fallback
@@ -384,11 +549,17 @@ class Catzilla:
                 set_allocator("malloc")
                 init_memory_system(1)  # 1 = quiet mode
             except:
-                _safe_print(
-                    "⚠️  Catzilla: Emergency fallback to uninitialized memory system"
-                )
+                _log.warning("Emergency fallback to uninitialized memory system")
                 pass
 
+    def _configure_jemalloc(self):
+        """Export jemalloc tuning options before the allocator initializes"""
+        conf = os.environ.get(_MALLOC_CONF_ENV, _DEFAULT_MALLOC_CONF)
+        if self.extra_malloc_conf and not conf.endswith(self.extra_malloc_conf):
+            # jemalloc applies options left to right, so extras win
+            conf = f"{conf},{self.extra_malloc_conf}"
+        os.environ[_MALLOC_CONF_ENV] = conf
+
     def get_memory_stats(self) -> dict:
         """Get comprehensive memory statistics
 
@@ -398,7 +569,7 @@ class Catzilla:
         try:
             # Get current allocator information
             current_allocator = get_current_allocator()
-            jemalloc_runtime_available = jemalloc_available()
+            jemalloc_runtime_available = _HAS_JEMALLOC
 
             # Base stats always include allocator information
             base_stats = {
@@ -423,15 +594,9 @@ class Catzilla:
 
             # Get detailed memory stats from C extension
             stats = get_memory_stats()
+            # allocated_mb / active_mb / fragmentation_percent come from C
             stats.update(base_stats)
 
-            # Add computed metrics
-            stats["allocated_mb"] = stats.get("allocated", 0) / (1024 * 1024)
-            stats["active_mb"] = stats.get("active", 0) / (1024 * 1024)
-            stats["fragmentation_percent"] = (
-                1.0 - stats.get("fragmentation_ratio", 1.0)
-            ) * 100
-
             # Add profiling info if enabled
             if self.memory_profiling:
                 stats["profiling_enabled"] = True
@@ -440,16 +605,10 @@ class Catzilla:
 
                 # Add efficiency trends if we have history
                 if len(self._memory_stats_history) > 1:
-                    recent = self._memory_stats_history[-1]
-                    previous = self._memory_stats_history[-2]
                     stats["memory_trend"] = {
-                        "allocated_change_mb": (
-                            recent.get("allocated_mb", 0)
-                            - previous.get("allocated_mb", 0)
-                        ),
-                        "fragmentation_change": (
-                            recent.get("fragmentation_percent", 0)
-                            - previous.get("fragmentation_percent", 0)
+                        "allocated_change_mb": self._memory_change("allocated_mb", 1),
+                        "fragmentation_change": self._memory_change(
+                            "fragmentation_percent", 1
                         ),
                     }
             else:
@@ -469,47 +628,42 @@ class Catzilla:
 
     def _start_memory_profiling(self):
         """Start automatic memory profiling"""
-        import threading
-        import time
 
         def profile_memory():
+            # Sample at startup, then once per interval; stop() sets the event
+            # to wake the thread immediately
             while self.memory_profiling and self._memory_optimization_active:
                 try:
                     current_time = time.time()
-                    if (
-                        current_time - self._last_memory_check
-                    ) >= self.memory_stats_interval:
-                        stats = self.get_memory_stats()
-                        if stats.get("jemalloc_enabled"):
-                            stats["timestamp"] = current_time
-                            self._memory_stats_history.append(stats)
-
-                            # Keep only last 100 entries to prevent memory growth
-                            if len(self._memory_stats_history) > 100:
-                                self._memory_stats_history = self._memory_stats_history[
-                                    -50:
-                                ]
-
-                            # Auto-tuning logic
-                            if self.auto_memory_tuning:
-                                self._auto_tune_memory(stats)
-
-                        self._last_memory_check = current_time
-
-                    time.sleep(5)  # Check every 5 seconds
+                    stats = self.get_memory_stats()
+                    if stats.get("jemalloc_enabled"):
+                        stats["timestamp"] = current_time
+                        # Bounded deque evicts the oldest entry on append
+                        self._memory_stats_history.append(stats)
+
+                        # Auto-tuning logic
+                        if self.auto_memory_tuning:
+                            self._auto_tune_memory(stats)
                 except Exception as e:
                     _safe_print(f"⚠️  Memory profiling error: {e}")
-                    time.sleep(10)
+
+                if self._profile_stop.wait(self.memory_stats_interval):
+                    break
 
         # Start profiling in background thread
         profile_thread = threading.Thread(target=profile_memory, daemon=True)
         profile_thread.start()
 
+    def _memory_change(self, key: str, back: int) -> float:
+        """Latest history value of `key` minus the value `back` samples earlier"""
+        # Indexing a deque near either end is O(1)
+        history = self._memory_stats_history
+        return history[-1][key] - history[-1 - back][key]
+
     def _auto_tune_memory(self, current_stats: dict):
         """Automatic memory tuning based on current statistics"""
         try:
-            fragmentation = current_stats.get("fragmentation_percent", 0)
-            allocated_mb = current_stats.get("allocated_mb", 0)
+            fragmentation = current_stats["fragmentation_percent"]
 
             # If fragmentation is high (>15%), suggest cleanup
             if fragmentation > 15:
@@ -520,9 +674,7 @@ class Catzilla:
 
             # If memory usage is growing rapidly, warn
             if len(self._memory_stats_history) > 2:
-                recent_growth = self._memory_stats_history[-1].get(
-                    "allocated_mb", 0
-                ) - self._memory_stats_history[-3].get("allocated_mb", 0)
+                recent_growth = self._memory_change("allocated_mb", 2)
                 if recent_growth > 50:  # 50MB growth in recent checks
                     _safe_print(
                         f"📈 Auto-tuning: Rapid memory growth detected (+{recent_growth:.1f}MB)"
@@ -538,7 +690,13 @@ class Catzilla:
 
         return {
             "profiling_enabled": True,
-            "stats_history": self._memory_stats_history[-10:],  # Last 10 entries
+            "stats_history": list(  # Last 10 entries
+                islice(
+                    self._memory_stats_history,
+                    max(len(self._memory_stats_history) - 10, 0),
+                    None,
+                )
+            ),
             "auto_tuning_enabled": self.auto_memory_tuning,
             "check_interval_seconds": self.memory_stats_interval,
             "total_checks": len(self._memory_stats_history),
@@ -613,30 +771,31 @@ class Catzilla:
 
     def _handle_request(self, client, method, path, body, request_capsule):
         """Internal request handler that bridges C and Python"""
-        import time
-
-        # Start timing for request logging
-        start_time = time.time()
+        # Read the monotonic clock once per request; middleware reuses it via
+        # request.context["_now_ns"] instead of making its own clock calls
+        start_ns = time.monotonic_ns()
         status_code = 200
-        response_size = 0
+        # Body size is only needed for the request log, so it is measured
+        # once in the finally block instead of encoding each body eagerly
+        sent_response = None
         error_message = None
 
         try:
-            # Get base path for routing (strip query string if present)
-            base_path = path.split("?", 1)[0] if "?" in path else path
-            query_string = path.split("?", 1)[1] if "?" in path else None
+            # Get base path for routing (strip query string if present);
+            # a single find() scan, no intermediate list
+            query_start = path.find("?")
+            if query_start < 0:
+                base_path = path
+                query_string = None
+            else:
+                base_path = path[:query_start]
+                query_string = path[query_start + 1 :]
 
-            # Create request object with empty query params dict - will be populated by C layer
-            request = Request(
-                method=method,
-                path=path,  # Use full path with query string
-                body=body,
-                client=client,
-                request_capsule=request_capsule,
-                _query_params={},  # Changed from query_params to _query_params
-            )  # Header extraction temporarily disabled for performance testing
-            # TODO: Re-enable with lazy loading for production
-            request.headers = {}
+            # Create request object positionally (method, full path with query
+            # string, body, client, capsule); headers and query params start
+            # empty and are loaded lazily from the C layer on access
+            request = Request(method, path, body, client, request_capsule)
+            request.context["_now_ns"] = start_ns
 
             # Match the route using our new router
             route, path_params, allowed_methods = self.router.match(method, base_path)
@@ -648,12 +807,7 @@ class Catzilla:
                 try:
                     # Check content type before calling handler
                     content_type = request.content_type
-                    if content_type and content_type not in [
-                        "application/json",
-                        "application/x-www-form-urlencoded",
-                        "text/plain",
-                        "multipart/form-data",
-                    ]:
+                    if content_type and content_type not in _ALLOWED_CONTENT_TYPES:
                         # Return 415 Unsupported Media Type
                         status_code = 415
                         err_resp = Response(
@@ -664,47 +818,72 @@ class Catzilla:
                                 "X-Error-Detail": f"Content-Type {content_type} is not supported"
                             },
                         )
-                        response_size = (
-                            len(err_resp.body.encode("utf-8")) if err_resp.body else 0
-                        )
+                        sent_response = err_resp
                         err_resp.send(client)
                         return
 
-                    # Execute global middleware first (pre-route)
-                    pre_route_middlewares = [
-                        mw
-                        for mw in self._registered_middlewares
-                        if mw.get("pre_route", True)
-                    ]
-                    # Sort by priority (lower numbers run first)
-                    pre_route_middlewares.sort(key=lambda x: x.get("priority", 50))
+                    # Execute global middleware first (pre-route, compiled at registration)
+                    try:
+                        middleware_result = self._pre_route_dispatch(request, base_path)
+                        if middleware_result is not None:
+                            # Global middleware returned a response - short circuit
+                            if isinstance(middleware_result, Response):
+                                status_code = middleware_result.status_code
+                                sent_response = middleware_result
+                                middleware_result.send(client)
+                                return  # Skip everything else
+                            else:
+                                # Invalid middleware return type
+                                error_resp = Response(
+                                    status_code=500,
+                                    content_type="text/plain",
+                                    body="Internal Server Error: Global middleware returned invalid type",
+                                )
+                                error_resp.send(client)
+                                return
+                    except Exception as middleware_error:
+                        # Global middleware failed
+                        if self.production:
+                            error_resp = self._get_clean_error_response(
+                                500, "Internal Server Error"
+                            )
+                        else:
+                            error_resp = Response(
+                                status_code=500,
+                                content_type="text/plain",
+                                body=f"Global Middleware Error: {str(middleware_error)}",
+                                headers={
+                                    "X-Global-Middleware-Error": str(middleware_error)
+                                },
+                            )
+                        status_code = 500
+                        sent_response = error_resp
+                        error_resp.send(client)
+                        return
 
-                    for middleware_info in pre_route_middlewares:
+                    # Execute per-route middleware before handler
+                    # (compiled into a single call at route registration)
+                    if route.middleware_chain is not None:
                         try:
-                            middleware_func = middleware_info["handler"]
-                            middleware_result = middleware_func(request)
+                            middleware_result = route.middleware_chain(request)
                             if middleware_result is not None:
-                                # Global middleware returned a response - short circuit
+                                # Middleware returned a response - short circuit
                                 if isinstance(middleware_result, Response):
                                     status_code = middleware_result.status_code
-                                    response_size = (
-                                        len(middleware_result.body.encode("utf-8"))
-                                        if middleware_result.body
-                                        else 0
-                                    )
+                                    sent_response = middleware_result
                                     middleware_result.send(client)
-                                    return  # Skip everything else
+                                    return  # Skip route handler
                                 else:
                                     # Invalid middleware return type
                                     error_resp = Response(
                                         status_code=500,
                                         content_type="text/plain",
-                                        body="Internal Server Error: Global middleware returned invalid type",
+                                        body="Internal Server Error: Middleware returned invalid type",
                                     )
                                     error_resp.send(client)
                                     return
                         except Exception as middleware_error:
-                            # Global middleware failed
+                            # Middleware failed
                             if self.production:
                                 error_resp = self._get_clean_error_response(
                                     500, "Internal Server Error"
@@ -713,72 +892,16 @@ class Catzilla:
                                 error_resp = Response(
                                     status_code=500,
                                     content_type="text/plain",
-                                    body=f"Global Middleware Error: {str(middleware_error)}",
+                                    body=f"Middleware Error: {str(middleware_error)}",
                                     headers={
-                                        "X-Global-Middleware-Error": str(
-                                            middleware_error
-                                        )
+                                        "X-Middleware-Error": str(middleware_error)
                                     },
                                 )
                             status_code = 500
-                            response_size = (
-                                len(error_resp.body.encode("utf-8"))
-                                if error_resp.body
-                                else 0
-                            )
+                            sent_response = error_resp
                             error_resp.send(client)
                             return
 
-                    # Execute per-route middleware before handler
-                    if hasattr(route, "middleware") and route.middleware:
-                        # Execute middleware chain
-                        for middleware_func in route.middleware:
-                            try:
-                                middleware_result = middleware_func(request)
-                                if middleware_result is not None:
-                                    # Middleware returned a response - short circuit
-                                    if isinstance(middleware_result, Response):
-                                        status_code = middleware_result.status_code
-                                        response_size = (
-                                            len(middleware_result.body.encode("utf-8"))
-                                            if middleware_result.body
-                                            else 0
-                                        )
-                                        middleware_result.send(client)
-                                        return  # Skip route handler
-                                    else:
-                                        # Invalid middleware return type
-                                        error_resp = Response(
-                                            status_code=500,
-                                            content_type="text/plain",
-                                            body="Internal Server Error: Middleware returned invalid type",
-                                        )
-                                        error_resp.send(client)
-                                        return
-                            except Exception as middleware_error:
-                                # Middleware failed
-                                if self.production:
-                                    error_resp = self._get_clean_error_response(
-                                        500, "Internal Server Error"
-                                    )
-                                else:
-                                    error_resp = Response(
-                                        status_code=500,
-                                        content_type="text/plain",
-                                        body=f"Middleware Error: {str(middleware_error)}",
-                                        headers={
-                                            "X-Middleware-Error": str(middleware_error)
-                                        },
-                                    )
-                                status_code = 500
-                                response_size = (
-                                    len(error_resp.body.encode("utf-8"))
-                                    if error_resp.body
-                                    else 0
-                                )
-                                error_resp.send(client)
-                                return
-
                     # Call the handler with hybrid async/sync execution
                     if self.enable_di:
                         # Create DI context for this request
@@ -794,66 +917,26 @@ class Catzilla:
                         # No DI - call handler directly with hybrid execution
                         response = self._execute_handler_hybrid(route.handler, request)
 
-                    # Normalize response based on return type
-                    if isinstance(response, Response):
-                        # Response object - use as is
-                        pass
-                    elif isinstance(response, dict):
-                        # Dictionary - convert to JSONResponse
-                        response = JSONResponse(response)
-                    elif isinstance(response, str):
-                        # String - convert to HTMLResponse
-                        response = HTMLResponse(response)
-                    else:
-                        # Unsupported type
-                        raise TypeError(
-                            f"Handler returned unsupported type {type(response)}. "
-                            "Must return Response, dict, or str."
-                        )
+                    # Normalize response (dict -> JSON, str -> HTML) with the
+                    # converter picked from the handler's return annotation
+                    response = route.response_normalizer(response)
 
                     # Capture response details for logging
                     status_code = response.status_code
-                    response_size = (
-                        len(response.body.encode("utf-8")) if response.body else 0
-                    )
 
-                    # Execute global post-route middleware
-                    post_route_middlewares = [
-                        mw
-                        for mw in self._registered_middlewares
-                        if mw.get("post_route", False)
-                    ]
-                    # Sort by priority (lower numbers run first)
-                    post_route_middlewares.sort(key=lambda x: x.get("priority", 50))
-
-                    for middleware_info in post_route_middlewares:
-                        try:
-                            middleware_func = middleware_info["handler"]
-                            # Post-route middleware gets both request and response
-                            if middleware_func.__code__.co_argcount == 2:
-                                middleware_result = middleware_func(request, response)
-                            else:
-                                # Legacy single-argument middleware
-                                middleware_result = middleware_func(request)
-
-                            if middleware_result is not None:
-                                # Post-route middleware can modify response
-                                if isinstance(middleware_result, Response):
-                                    response = middleware_result
-                                    status_code = response.status_code
-                                    response_size = (
-                                        len(response.body.encode("utf-8"))
-                                        if response.body
-                                        else 0
-                                    )
-                        except Exception as middleware_error:
-                            # Post-route middleware failed - log but don't break response
-                            if not self.production:
-                                print(
-                                    f"Warning: Post-route middleware '{middleware_info.get('name', 'unknown')}' failed: {middleware_error}"
-                                )
+                    # Execute global post-route middleware (compiled at registration);
+                    # failures are reported inside and never break the response
+                    if self._post_route_chain:
+                        final_response = self._post_route_dispatch(
+                            request, response, base_path
+                        )
+                        if final_response is not response:
+                            # Post-route middleware replaced the response
+                            response = final_response
+                            status_code = response.status_code
 
                     # Send the response
+                    sent_response = response
                     response.send(client)
                 except Exception as e:
                     # Handle exceptions using the centralized error handling system
@@ -861,9 +944,7 @@ class Catzilla:
                     error_message = str(e)
                     err_resp = self._handle_exception(request, e)
                     status_code = err_resp.status_code
-                    response_size = (
-                        len(err_resp.body.encode("utf-8")) if err_resp.body else 0
-                    )
+                    sent_response = err_resp
                     err_resp.send(client)
             else:
                 if allowed_methods:
@@ -873,7 +954,7 @@ class Catzilla:
                         not_allowed = self._get_clean_error_response(
                             405,
                             "Method not allowed",
-                            f"Allowed methods: {', '.join(sorted(allowed_methods))}",
+                            f"Allowed methods: {allowed_methods.allow_header}",
                         )
                     else:
                         not_allowed = Response(
@@ -881,13 +962,11 @@ class Catzilla:
                             content_type="text/plain",
                             body=f"Method Not Allowed: {method} {path}",
                             headers={
-                                "Allow": ", ".join(sorted(allowed_methods)),
+                                "Allow": allowed_methods.allow_header,
                                 "X-Error-Path": path,
                             },
                         )
-                    response_size = (
-                        len(not_allowed.body.encode("utf-8")) if not_allowed.body else 0
-                    )
+                    sent_response = not_allowed
                     not_allowed.send(client)
                 else:
                     # No route found - use custom 404 handler if set
@@ -896,11 +975,7 @@ class Catzilla:
                         try:
                             not_found_resp = self._not_found_handler(request)
                             status_code = not_found_resp.status_code
-                            response_size = (
-                                len(not_found_resp.body.encode("utf-8"))
-                                if not_found_resp.body
-                                else 0
-                            )
+                            sent_response = not_found_resp
                             not_found_resp.send(client)
                         except Exception as handler_error:
                             # 404 handler failed, fall back to default
@@ -917,11 +992,7 @@ class Catzilla:
                                     body=f"404 handler failed: {str(handler_error)}",
                                     headers={"X-Error-Detail": str(handler_error)},
                                 )
-                            response_size = (
-                                len(fallback_resp.body.encode("utf-8"))
-                                if fallback_resp.body
-                                else 0
-                            )
+                            sent_response = fallback_resp
                             fallback_resp.send(client)
                     else:
                         # Default 404 handling
@@ -934,16 +1005,21 @@ class Catzilla:
                                 body=f"Not Found: {method} {path}",
                                 headers={"X-Error-Path": path},
                             )
-                        response_size = (
-                            len(not_found.body.encode("utf-8")) if not_found.body else 0
-                        )
+                        sent_response = not_found
                         not_found.send(client)
 
         finally:
             # Log the request if logging is enabled
             if self.logger and self.log_requests:
-                duration_ms = (time.time() - start_time) * 1000
+                duration_ms = (time.monotonic_ns() - start_ns) / 1e6
                 client_ip = getattr(client, "remote_addr", "127.0.0.1")
+                sent_body = sent_response.body if sent_response is not None else None
+                if not sent_body:
+                    response_size = 0
+                elif isinstance(sent_body, str):
+                    response_size = len(sent_body.encode("utf-8"))
+                else:
+                    response_size = len(sent_body)
 
                 self.logger.log_request(
                     method=method,
@@ -974,10 +1050,7 @@ class Catzilla:
                 enhanced_handler = handler
 
             # Apply auto-validation if enabled
-            if self.auto_validation:
-                validated_handler = create_auto_validated_handler(enhanced_handler)
-            else:
-                validated_handler = enhanced_handler
+            validated_handler = self._wrap_handler(enhanced_handler)
 
             # Register the (possibly auto-validated and DI-enhanced) handler
             return self.router.route(path, methods, overwrite=overwrite)(
@@ -986,6 +1059,51 @@ class Catzilla:
 
         return decorator
 
+    def _make_method_decorator(
+        self,
+        method: str,
+        path: str,
+        overwrite: bool,
+        dependencies: Optional[List[str]],
+        middleware: Optional[List[Callable]],
+    ) -> Callable[[RouteHandler], RouteHandler]:
+        """Build the registration decorator shared by get/post/put/... routes"""
+        # A partial over one bound method instead of a fresh closure per route
+        return functools.partial(
+            self._register_method_route,
+            method,
+            path,
+            overwrite,
+            dependencies,
+            middleware,
+        )
+
+    def _register_method_route(
+        self,
+        method: str,
+        path: str,
+        overwrite: bool,
+        dependencies: Optional[List[str]],
+        middleware: Optional[List[Callable]],
+        handler: RouteHandler,
+    ) -> RouteHandler:
+        """Wrap a handler with DI/auto-validation and add it to the router"""
+        # Buffer route registration for clean startup
+        if self._routes_buffered:
+            handler_name = getattr(handler, "__name__", "unknown")
+            self._route_buffer.append(f"📍 {method:<8}{path} → {handler_name}")
+
+        # Apply dependency injection if enabled
+        if self.enable_di:
+            handler = self.di_enhancer.enhance_route(handler, dependencies)
+
+        # Auto-validation wrapper (or identity) chosen once in __init__
+        validated_handler = self._wrap_handler(handler)
+        self.router.add_route(
+            method, path, validated_handler, overwrite=overwrite, middleware=middleware
+        )
+        return validated_handler
+
     def get(
         self,
         path: str,
@@ -995,30 +1113,9 @@ class Catzilla:
         middleware: Optional[List[Callable]] = None,
     ):
         """Register a GET route handler with optional dependency injection and per-route middleware"""
-
-        def decorator(handler: RouteHandler):
-            # Buffer route registration for clean startup
-            if self._routes_buffered:
-                handler_name = getattr(handler, "__name__", "unknown")
-                self._route_buffer.append(f"📍 GET     {path} → {handler_name}")
-
-            # Apply dependency injection if enabled
-            if self.enable_di:
-                enhanced_handler = self.di_enhancer.enhance_route(handler, dependencies)
-            else:
-                enhanced_handler = handler
-
-            # Apply auto-validation if enabled
-            if self.auto_validation:
-                validated_handler = create_auto_validated_handler(enhanced_handler)
-            else:
-                validated_handler = enhanced_handler
-
-            return self.router.get(path, overwrite=overwrite, middleware=middleware)(
-                validated_handler
-            )
-
-        return decorator
+        return self._make_method_decorator(
+            "GET", path, overwrite, dependencies, middleware
+        )
 
     def post(
         self,
@@ -1029,30 +1126,9 @@ class Catzilla:
         middleware: Optional[List[Callable]] = None,
     ):
         """Register a POST route handler with optional dependency injection and per-route middleware"""
-
-        def decorator(handler: RouteHandler):
-            # Buffer route registration for clean startup
-            if self._routes_buffered:
-                handler_name = getattr(handler, "__name__", "unknown")
-                self._route_buffer.append(f"📍 POST    {path} → {handler_name}")
-
-            # Apply dependency injection if enabled
-            if self.enable_di:
-                enhanced_handler = self.di_enhancer.enhance_route(handler, dependencies)
-            else:
-                enhanced_handler = handler
-
-            # Apply auto-validation if enabled
-            if self.auto_validation:
-                validated_handler = create_auto_validated_handler(enhanced_handler)
-            else:
-                validated_handler = enhanced_handler
-
-            return self.router.post(path, overwrite=overwrite, middleware=middleware)(
-                validated_handler
-            )
-
-        return decorator
+        return self._make_method_decorator(
+            "POST", path, overwrite, dependencies, middleware
+        )
 
     def put(
         self,
@@ -1063,30 +1139,9 @@ class Catzilla:
         middleware: Optional[List[Callable]] = None,
     ):
         """Register a PUT route handler with optional dependency injection and per-route middleware"""
-
-        def decorator(handler: RouteHandler):
-            # Buffer route registration for clean startup
-            if self._routes_buffered:
-                handler_name = getattr(handler, "__name__", "unknown")
-                self._route_buffer.append(f"📍 PUT     {path} → {handler_name}")
-
-            # Apply dependency injection if enabled
-            if self.enable_di:
-                enhanced_handler = self.di_enhancer.enhance_route(handler, dependencies)
-            else:
-                enhanced_handler = handler
-
-            # Apply auto-validation if enabled
-            if self.auto_validation:
-                validated_handler = create_auto_validated_handler(enhanced_handler)
-            else:
-                validated_handler = enhanced_handler
-
-            return self.router.put(path, overwrite=overwrite, middleware=middleware)(
-                validated_handler
-            )
-
-        return decorator
+        return self._make_method_decorator(
+            "PUT", path, overwrite, dependencies, middleware
+        )
 
     def delete(
         self,
@@ -1097,30 +1152,9 @@ class Catzilla:
         middleware: Optional[List[Callable]] = None,
     ):
         """Register a DELETE route handler with optional dependency injection and per-route middleware"""
-
-        def decorator(handler: RouteHandler):
-            # Buffer route registration for clean startup
-            if self._routes_buffered:
-                handler_name = getattr(handler, "__name__", "unknown")
-                self._route_buffer.append(f"📍 DELETE  {path} → {handler_name}")
-
-            # Apply dependency injection if enabled
-            if self.enable_di:
-                enhanced_handler = self.di_enhancer.enhance_route(handler, dependencies)
-            else:
-                enhanced_handler = handler
-
-            # Apply auto-validation if enabled
-            if self.auto_validation:
-                validated_handler = create_auto_validated_handler(enhanced_handler)
-            else:
-                validated_handler = enhanced_handler
-
-            return self.router.delete(path, overwrite=overwrite, middleware=middleware)(
-                validated_handler
-            )
-
-        return decorator
+        return self._make_method_decorator(
+            "DELETE", path, overwrite, dependencies, middleware
+        )
 
     def patch(
         self,
@@ -1131,25 +1165,9 @@ class Catzilla:
         middleware: Optional[List[Callable]] = None,
     ):
         """Register a PATCH route handler with optional dependency injection and per-route middleware"""
-
-        def decorator(handler: RouteHandler):
-            # Apply dependency injection if enabled
-            if self.enable_di:
-                enhanced_handler = self.di_enhancer.enhance_route(handler, dependencies)
-            else:
-                enhanced_handler = handler
-
-            # Apply auto-validation if enabled
-            if self.auto_validation:
-                validated_handler = create_auto_validated_handler(enhanced_handler)
-            else:
-                validated_handler = enhanced_handler
-
-            return self.router.patch(path, overwrite=overwrite, middleware=middleware)(
-                validated_handler
-            )
-
-        return decorator
+        return self._make_method_decorator(
+            "PATCH", path, overwrite, dependencies, middleware
+        )
 
     def options(
         self,
@@ -1160,25 +1178,9 @@ class Catzilla:
         middleware: Optional[List[Callable]] = None,
     ):
         """Register an OPTIONS route handler with optional dependency injection and per-route middleware"""
-
-        def decorator(handler: RouteHandler):
-            # Apply dependency injection if enabled
-            if self.enable_di:
-                enhanced_handler = self.di_enhancer.enhance_route(handler, dependencies)
-            else:
-                enhanced_handler = handler
-
-            # Apply auto-validation if enabled
-            if self.auto_validation:
-                validated_handler = create_auto_validated_handler(enhanced_handler)
-            else:
-                validated_handler = enhanced_handler
-
-            return self.router.options(
-                path, overwrite=overwrite, middleware=middleware
-            )(validated_handler)
-
-        return decorator
+        return self._make_method_decorator(
+            "OPTIONS", path, overwrite, dependencies, middleware
+        )
 
     def head(
         self,
@@ -1189,25 +1191,9 @@ class Catzilla:
         middleware: Optional[List[Callable]] = None,
     ):
         """Register a HEAD route handler with optional dependency injection and per-route middleware"""
-
-        def decorator(handler: RouteHandler):
-            # Apply dependency injection if enabled
-            if self.enable_di:
-                enhanced_handler = self.di_enhancer.enhance_route(handler, dependencies)
-            else:
-                enhanced_handler = handler
-
-            # Apply auto-validation if enabled
-            if self.auto_validation:
-                validated_handler = create_auto_validated_handler(enhanced_handler)
-            else:
-                validated_handler = enhanced_handler
-
-            return self.router.head(path, overwrite=overwrite, middleware=middleware)(
-                validated_handler
-            )
-
-        return decorator
+        return self._make_method_decorator(
+            "HEAD", path, overwrite, dependencies, middleware
+        )
 
     def _call_c_extension(self, method_name: str, *args) -> Any:
         """Call C extension method with fallback handling"""
@@ -1230,6 +1216,7 @@ class Catzilla:
         pre_route: bool = True,
         post_route: bool = False,
         name: Optional[str] = None,
+        skip_paths: Optional[Iterable[str]] = None,
     ):
         """Register middleware with the Zero-Allocation Middleware System
 
@@ -1238,7 +1225,14 @@ class Catzilla:
             pre_route: Whether to run before route handling
             post_route: Whether to run after route handling
             name: Optional middleware name for debugging
+            skip_paths: Exact request paths (without query string) this
+                middleware should not run for, e.g. health or metrics endpoints
+
+        Note:
+            Both ``def`` and ``async def`` middleware are supported. Whether a
+            middleware is async is detected once at registration time.
         """
+        frozen_skip_paths: FrozenSet[str] = frozenset(skip_paths or ())
 
         def decorator(handler: Callable):
             # Register with the middleware system
@@ -1257,12 +1251,40 @@ class Catzilla:
                     "pre_route": pre_route,
                     "post_route": post_route,
                     "name": name or handler.__name__,
+                    "accepts_response": (
+                        getattr(handler, "__code__", None) is not None
+                        and handler.__code__.co_argcount == 2
+                    ),
+                    "skip_paths": frozen_skip_paths,
+                    # Classified once here so dispatch never re-inspects it
+                    "is_async": is_async_handler(handler),
                 }
             )
+            self._rebuild_middleware_chains()
             return handler
 
         return decorator
 
+    def _rebuild_middleware_chains(self):
+        """Rebuild the priority-sorted pre/post-route middleware chains
+
+        Runs at registration time so request dispatch iterates ready-made
+        tuples instead of filtering and sorting the registry per request.
+        """
+        # Sort by priority (lower numbers run first); sorted() is stable
+        ordered = sorted(
+            self._registered_middlewares, key=lambda mw: mw.get("priority", 50)
+        )
+        self._pre_route_chain = tuple(mw for mw in ordered if mw.get("pre_route", True))
+        self._post_route_chain = tuple(
+            mw for mw in ordered if mw.get("post_route", False)
+        )
+        self._pre_route_dispatch = _compile_pre_route_dispatch(self._pre_route_chain)
+        self._post_route_dispatch = _compile_post_route_dispatch(
+            self._post_route_chain,
+            None if self.production else _warn_post_route_failure,
+        )
+
     def get_middleware_stats(self) -> Dict[str, Any]:
         """Get middleware performance statistics"""
         return self.middleware_system.get_stats()
@@ -1815,9 +1837,14 @@ class Catzilla:
 
         # Routes are already logged during registration, no need to log again here
 
-        # Add our Python handler for all registered routes
-        for route in self.router.routes():
-            self.server.add_route(route["method"], route["path"], self._handle_request)
+        # Add our Python handler for all registered routes in a single C call
+        handler = self._handle_request
+        self.server.add_routes(
+            [
+                (route["method"], route["path"], handler)
+                for route in self.router.routes()
+            ]
+        )
 
         # Display buffered routes after banner
         self._display_buffered_routes()
@@ -1827,6 +1854,7 @@ class Catzilla:
 
     def stop(self):
         """Stop the server"""
+        self._profile_stop.set()
         self.server.stop()
 
     def set_exception_handler(
@@ -1880,6 +1908,14 @@ class Catzilla:
         self, status_code: int, message: str, detail: Optional[str] = None
     ) -> Response:
         """Create a clean JSON error response for production mode"""
+        if self.production:
+            # Detail is never exposed in production, so the response is fixed
+            response = self._error_responses.get((status_code, message))
+            if response is None:
+                response = _PrerenderedResponse(status_code, message)
+                self._error_responses[status_code, message] = response
+            return response
+
         error_data = {"error": message}
         if detail and not self.production:
             error_data["detail"] = detail
@@ -1945,14 +1981,14 @@ class Catzilla:
         try:
             return {
                 "current_allocator": get_current_allocator(),
-                "jemalloc_available": jemalloc_available(),
+                "jemalloc_available": _HAS_JEMALLOC,
                 "jemalloc_requested": self.use_jemalloc,
                 "jemalloc_enabled": self.has_jemalloc,
                 "memory_profiling": self.memory_profiling,
                 "auto_memory_tuning": self.auto_memory_tuning,
                 "memory_stats_interval": self.memory_stats_interval,
                 "can_switch_allocator": False,  # Cannot switch after initialization
-                "build_supports_jemalloc": jemalloc_available(),
+                "build_supports_jemalloc": _HAS_JEMALLOC,
                 "status": (
                     "initialized"
                     if self.has_jemalloc or not self.use_jemalloc
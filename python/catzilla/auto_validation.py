@@ -716,6 +716,25 @@ def _validate_constraints(value: Any, constraints) -> None:
                 )
 
 
+def _may_need_validation(handler: Callable) -> bool:
+    """
+    Cheap pre-check run before building an AutoValidationSpec
+
+    A plain function whose only annotated parameter is ``request`` and which
+    has no defaults cannot carry a Query/Path/Header/Form marker or a
+    BaseModel, so the full signature inspection can be skipped.
+    """
+    # inspect.signature() follows __wrapped__, so check what it would see
+    target = inspect.unwrap(handler)
+    if getattr(target, "__code__", None) is None or hasattr(handler, "__signature__"):
+        # Partials, callable objects and explicit signatures get full inspection
+        return True
+    if target.__defaults__ or target.__kwdefaults__:
+        return True
+    annotations = target.__annotations__
+    return any(name != "request" and name != "return" for name in annotations)
+
+
 def create_auto_validated_handler(handler: Callable) -> Callable:
     """
     Create an auto-validated wrapper for a route handler
@@ -723,6 +742,10 @@ def create_auto_validated_handler(handler: Callable) -> Callable:
     This function inspects the handler signature once at startup and creates
     an optimized wrapper that performs ultra-fast validation on each request.
     """
+    # Handlers like ``def index(request)`` need no wrapper or inspection
+    if not _may_need_validation(handler):
+        return handler
+
     # Pre-compile validation specification (one-time startup cost: ~5μs)
     validation_spec = AutoValidationSpec(handler)
 
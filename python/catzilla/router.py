@@ -6,11 +6,14 @@ router for route matching while maintaining Python's flexibility for route
 management and organization.
 """
 
+import asyncio
+import inspect
 import re
 from dataclasses import dataclass
-from typing import Callable, Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
-from .types import Request, Response, RouteHandler
+from .async_detector import is_async_handler
+from .types import HTMLResponse, JSONResponse, Request, Response, RouteHandler
 
 # Import auto-validation system for RouterGroup support
 try:
@@ -35,7 +38,95 @@ class Route:
     tags: List[str] = None  # Tags for API organization
     description: str = ""  # Route description
     metadata: Dict[str, any] = None  # Additional metadata
-    middleware: List[Callable] = None  # Per-route middleware (NEW!)
+    middleware: Tuple[Callable, ...] = None  # Per-route middleware, frozen
+    middleware_chain: Optional[Callable] = None  # Compiled per-route chain
+    response_normalizer: Optional[Callable] = None  # Handler result -> Response
+
+
+def _normalize_response(response: Any) -> Response:
+    """Convert a handler result to a Response (dict -> JSON, str -> HTML)"""
+    if isinstance(response, Response):
+        return response
+    if isinstance(response, dict):
+        return JSONResponse(response)
+    if isinstance(response, str):
+        return HTMLResponse(response)
+    raise TypeError(
+        f"Handler returned unsupported type {type(response)}. "
+        "Must return Response, dict, or str."
+    )
+
+
+def _normalize_dict_response(response: Any) -> Response:
+    """Normalizer for handlers annotated to return dict"""
+    if type(response) is dict:
+        return JSONResponse(response)
+    return _normalize_response(response)
+
+
+def _normalize_str_response(response: Any) -> Response:
+    """Normalizer for handlers annotated to return str"""
+    if type(response) is str:
+        return HTMLResponse(response)
+    return _normalize_response(response)
+
+
+def _select_response_normalizer(handler: Callable) -> Callable:
+    """Pick a handler's result normalizer from its return annotation
+
+    Resolved once at registration. Annotated dict/str handlers get a
+    single identity check on their expected type; anything else (including
+    a handler that does not return what it declares) falls back to the
+    full isinstance ladder.
+    """
+    try:
+        original = inspect.unwrap(handler)
+    except ValueError:
+        original = handler
+    annotation = getattr(original, "__annotations__", {}).get("return")
+    # Accept both plain and typing generics, e.g. Dict[str, Any]
+    annotation = getattr(annotation, "__origin__", annotation)
+    if annotation is dict:
+        return _normalize_dict_response
+    if annotation is str:
+        return _normalize_str_response
+    return _normalize_response
+
+
+def _compile_middleware_chain(middleware: Tuple[Callable, ...]) -> Callable:
+    """Compile per-route middleware into one straight-line function
+
+    The generated function calls each middleware in order and returns the
+    first non-None result (or None), so dispatch makes a single call per
+    route instead of looping over the tuple. Async middleware is detected
+    here once and driven with asyncio.run() inline.
+    """
+    namespace = {"_run_async": asyncio.run}
+    lines = ["def _middleware_chain(request):"]
+    for index, middleware_func in enumerate(middleware):
+        name = f"_mw{index}"
+        namespace[name] = middleware_func
+        if is_async_handler(middleware_func):
+            lines.append(f"    result = _run_async({name}(request))")
+        else:
+            lines.append(f"    result = {name}(request)")
+        lines.append("    if result is not None:")
+        lines.append("        return result")
+    lines.append("    return None")
+
+    exec(compile("\n".join(lines), "<catzilla-middleware-chain>", "exec"), namespace)
+    return namespace["_middleware_chain"]
+
+
+class AllowedMethods(frozenset):
+    """Methods registered for a path, with its ``Allow`` header precomputed"""
+
+    __slots__ = ("allow_header",)
+
+    def __new__(cls, methods):
+        self = super().__new__(cls, methods)
+        self.allow_header = ", ".join(sorted(self))
+        return self
 
 
 class RouteNode:
@@ -452,6 +543,8 @@ class CAcceleratedRouter:
         self._c_routes_synced = False
         self._use_c_router = False
         self._server = None
+        # Interned AllowedMethods for 405 responses, keyed by the method set
+        self._allowed_methods_cache: Dict[Any, AllowedMethods] = {}
 
         # Try to create a dedicated server instance for C routing
         try:
@@ -492,6 +585,9 @@ class CAcceleratedRouter:
         pattern_str = f"^{pattern_str}$"
         pattern = re.compile(pattern_str)
 
+        # Freeze per-route middleware once so dispatch iterates a tuple
+        middleware = tuple(middleware) if middleware else None
+
         # Create Python route object
         route = Route(
             method=method,
@@ -504,6 +600,10 @@ class CAcceleratedRouter:
             description=metadata.get("description", ""),
             metadata=metadata,
             middleware=middleware,  # Store per-route middleware
+            middleware_chain=(
+                _compile_middleware_chain(middleware) if middleware else None
+            ),
+            response_normalizer=_select_response_normalizer(handler),
         )
 
         # Check for conflicts if not overwriting
@@ -536,7 +636,7 @@ class CAcceleratedRouter:
                 if middleware:
                     # If per-route middleware is specified, use the middleware-aware function
                     self._server.add_c_route_with_middleware(
-                        method, path, route_id, middleware
+                        method, path, route_id, list(middleware)
                     )
                 else:
                     # No middleware, use the regular function
@@ -557,7 +657,8 @@ class CAcceleratedRouter:
         Returns:
             - Route object if matched, None otherwise
             - Path parameters dictionary
-            - Set of allowed methods if path exists but method doesn't match
+            - AllowedMethods (a frozenset with a cached ``allow_header``) if the
+              path exists but the method doesn't match
         """
         # Normalize method to uppercase
         method = method.upper()
@@ -583,7 +684,16 @@ class CAcceleratedRouter:
                     # Method not allowed - path exists but method doesn't match
                     allowed_methods_str = match_result.get("allowed_methods")
                     if allowed_methods_str:
-                        allowed_methods = set(allowed_methods_str.split(", "))
+                        allowed_methods = self._allowed_methods_cache.get(
+                            allowed_methods_str
+                        )
+                        if allowed_methods is None:
+                            allowed_methods = AllowedMethods(
+                                allowed_methods_str.split(", ")
+                            )
+                            self._allowed_methods_cache[allowed_methods_str] = (
+                                allowed_methods
+                            )
                         return None, {}, allowed_methods
                     else:
                         return None, {}, set()
@@ -644,7 +754,11 @@ class CAcceleratedRouter:
 
         if path_exists:
             # Path exists but method not allowed
-            return None, {}, allowed_methods
+            key = frozenset(allowed_methods)
+            cached = self._allowed_methods_cache.get(key)
+            if cached is None:
+                cached = self._allowed_methods_cache[key] = AllowedMethods(key)
+            return None, {}, cached
 
         # No match found
         return None, {}, None
@@ -5,7 +5,7 @@ Type definitions for Catzilla
 import json
 from dataclasses import dataclass
 from http.cookies import SimpleCookie
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from urllib.parse import parse_qs
 
 from .ui import log_types_debug, log_types_error
@@ -21,6 +21,9 @@ class Request:
     client: Any  # The client capsule from C
     request_capsule: Any  # The request capsule from C
     headers: Dict[str, str] = None
+    # Per-request storage shared by middleware: a dict unless middleware
+    # replaces it with its own state object
+    context: Any = None
     _query_params: Dict[str, str] = None  # Internal storage for query params
     _path_params: Dict[str, str] = None  # Internal storage for path params
     _client_ip: Optional[str] = None
@@ -34,14 +37,14 @@ class Request:
     def __post_init__(self):
         if self.headers is None:
             self.headers = {}
-        if self._query_params is None:
-            self._query_params = {}
+        elif self.headers:
+            # Normalize header keys to lowercase for consistent access
+            self.headers = {k.lower(): v for k, v in self.headers.items()}
+        if self.context is None:
+            self.context = {}
         if self._path_params is None:
             self._path_params = {}
 
-        # Normalize header keys to lowercase for consistent access
-        self.headers = {k.lower(): v for k, v in self.headers.items()}
-
     @property
     def path_params(self) -> Dict[str, str]:
         """Get path parameters extracted from the URL"""
@@ -55,13 +58,17 @@ class Request:
     @property
     def query_params(self) -> Dict[str, str]:
         """Lazily load query parameters from C when accessed"""
+        if self._query_params is None:
+            # Allocated on first access; most handlers never read query params
+            self._query_params = {}
         if not self._loaded_query_params:
             try:
                 from catzilla._catzilla import get_query_param
 
                 # Try to get each parameter from the query string
-                if "?" in self.path:
-                    query_string = self.path.split("?", 1)[1]
+                query_start = self.path.find("?")
+                if query_start >= 0:
+                    query_string = self.path[query_start + 1 :]
                     for pair in query_string.split("&"):
                         if "=" in pair:
                             key = pair.split("=", 1)[0]
@@ -80,7 +87,7 @@ class Request:
     @query_params.setter
     def query_params(self, value: Dict[str, str]):
         """Set query parameters"""
-        self._query_params = value
+        self._query_params = {} if value is None else value
 
     def json(self) -> Any:
         """Parse body as JSON"""
@@ -353,6 +360,9 @@ class Request:
 class Response:
     """Base HTTP Response class"""
 
+    # Fixed slots: one allocation per response, no per-instance __dict__
+    __slots__ = ("status_code", "content_type", "body", "_headers", "_cookies")
+
     def __init__(
         self,
         status_code: int = 200,
@@ -364,7 +374,7 @@ class Response:
         self.content_type = content_type
         self.body = body
         self._headers = {}
-        self._cookies = SimpleCookie()
+        self._cookies = None  # Created by set_cookie() on first use
 
         # Normalize and set headers
         if headers:
@@ -419,6 +429,8 @@ class Response:
         samesite: Optional[str] = None,
     ) -> None:
         """Set a cookie with the given name and value."""
+        if self._cookies is None:
+            self._cookies = SimpleCookie()
         self._cookies[name] = value
         morsel = self._cookies[name]
 
@@ -445,6 +457,11 @@ class Response:
         """Send the response using the C extension"""
         from catzilla._catzilla import send_response
 
+        headers_str, body_str = self._render()
+        send_response(client, self.status_code, headers_str, body_str)
+
+    def _render(self) -> Tuple[str, Any]:
+        """Format the header block and body in the shape send_response expects"""
         # Calculate body length in bytes for Content-Length header
         body_bytes = (
             self.body.encode("utf-8") if isinstance(self.body, str) else self.body
@@ -474,17 +491,18 @@ class Response:
         # Join headers with proper HTTP line endings
         headers_str = "\r\n".join(headers) + "\r\n" if headers else ""
 
-        # Send response with formatted headers
         # Convert body to string for C interface
         body_str = (
             body_bytes.decode("utf-8") if isinstance(body_bytes, bytes) else self.body
         )
-        send_response(client, self.status_code, headers_str, body_str)
+        return headers_str, body_str
 
 
 class JSONResponse(Response):
     """HTTP Response with JSON body"""
 
+    __slots__ = ()
+
     def __init__(
         self,
         data: Any,
@@ -509,6 +527,8 @@ class JSONResponse(Response):
 class HTMLResponse(Response):
     """HTTP Response with HTML body"""
 
+    __slots__ = ()
+
     def __init__(
         self,
         html: str,
@@ -449,16 +449,13 @@ static PyObject* CatzillaServer_listen(CatzillaServerObject *self, PyObject *arg
     Py_RETURN_NONE;
 }
 
-// add_route(method, path, handler)
-static PyObject* CatzillaServer_add_route(CatzillaServerObject *self, PyObject *args)
+// Register a single Python route handler with the server; returns 0 on success
+static int CatzillaServer_register_route(CatzillaServerObject *self, const char *method,
+                                         const char *path, PyObject *handler)
 {
-    const char *method, *path;
-    PyObject *handler;
-    if (!PyArg_ParseTuple(args, "ssO", &method, &path, &handler))
-        return NULL;
     if (!PyCallable_Check(handler)) {
         PyErr_SetString(PyExc_TypeError, "Handler must be callable");
-        return NULL;
+        return -1;
     }
 
     // Replace previous callback
@@ -468,7 +465,7 @@ static PyObject* CatzillaServer_add_route(CatzillaServerObject *self, PyObject *
 
     // Store in routes dict
     if (PyDict_SetItemString(self->route_data->routes, path, handler) < 0)
-        return NULL;
+        return -1;
 
     // CRITICAL FIX: Register the Python callback with the C server
     catzilla_server_set_request_callback(&self->server, self->route_data->callback);
@@ -476,8 +473,46 @@ static PyObject* CatzillaServer_add_route(CatzillaServerObject *self, PyObject *
     // Register route with C core - use universal Python handler
     if (catzilla_server_add_route(&self->server, method, path, catzilla_python_route_handler, (void*)handler) != 0) {
         PyErr_SetString(PyExc_RuntimeError, "Failed to add route");
+        return -1;
+    }
+    return 0;
+}
+
+// add_route(method, path, handler)
+static PyObject* CatzillaServer_add_route(CatzillaServerObject *self, PyObject *args)
+{
+    const char *method, *path;
+    PyObject *handler;
+    if (!PyArg_ParseTuple(args, "ssO", &method, &path, &handler))
         return NULL;
+    if (CatzillaServer_register_route(self, method, path, handler) < 0)
+        return NULL;
+    Py_RETURN_NONE;
+}
+
+// add_routes(routes) - Register an iterable of (method, path, handler) tuples in one call
+static PyObject* CatzillaServer_add_routes(CatzillaServerObject *self, PyObject *args)
+{
+    PyObject *routes;
+    if (!PyArg_ParseTuple(args, "O", &routes))
+        return NULL;
+
+    PyObject *seq = PySequence_Fast(routes, "routes must be an iterable of (method, path, handler) tuples");
+    if (!seq)
+        return NULL;
+
+    Py_ssize_t count = PySequence_Fast_GET_SIZE(seq);
+    PyObject **items = PySequence_Fast_ITEMS(seq);
+    for (Py_ssize_t i = 0; i < count; i++) {
+        const char *method, *path;
+        PyObject *handler;
+        if (!PyArg_ParseTuple(items[i], "ssO", &method, &path, &handler) ||
+            CatzillaServer_register_route(self, method, path, handler) < 0) {
+            Py_DECREF(seq);
+            return NULL;
+        }
     }
+    Py_DECREF(seq);
     Py_RETURN_NONE;
 }
 
@@ -2022,7 +2057,9 @@ static PyObject* get_memory_stats(PyObject *self, PyObject *args)
     catzilla_memory_stats_t stats;
     catzilla_memory_get_stats(&stats);
 
-    return Py_BuildValue("{s:K,s:K,s:K,s:K,s:d,s:K,s:K,s:d,s:K,s:K,s:K,s:K,s:K,s:K}",
+    // Unit conversions are done here where the raw counters live, so callers
+    // get ready-to-report values without re-reading the dict
+    return Py_BuildValue("{s:K,s:K,s:K,s:K,s:d,s:K,s:K,s:d,s:K,s:K,s:K,s:K,s:K,s:K,s:d,s:d,s:d}",
         "allocated", (unsigned long long)stats.allocated,
         "active", (unsigned long long)stats.active,
         "metadata", (unsigned long long)stats.metadata,
@@ -2036,7 +2073,10 @@ static PyObject* get_memory_stats(PyObject *self, PyObject *args)
         "response_arena_usage", (unsigned long long)stats.response_arena_usage,
         "cache_arena_usage", (unsigned long long)stats.cache_arena_usage,
         "static_arena_usage", (unsigned long long)stats.static_arena_usage,
-        "task_arena_usage", (unsigned long long)stats.task_arena_usage
+        "task_arena_usage", (unsigned long long)stats.task_arena_usage,
+        "allocated_mb", (double)stats.allocated / (1024.0 * 1024.0),
+        "active_mb", (double)stats.active / (1024.0 * 1024.0),
+        "fragmentation_percent", (1.0 - stats.fragmentation_ratio) * 100.0
     );
 }
 
@@ -2364,6 +2404,7 @@ static PyTypeObject CatzillaCacheType = {
 static PyMethodDef CatzillaServer_methods[] = {
     {"listen",    (PyCFunction)CatzillaServer_listen,   METH_VARARGS, "Start listening"},
     {"add_route", (PyCFunction)CatzillaServer_add_route, METH_VARARGS, "Add HTTP route"},
+    {"add_routes", (PyCFunction)CatzillaServer_add_routes, METH_VARARGS, "Add HTTP routes from (method, path, handler) tuples"},
     {"stop",      (PyCFunction)CatzillaServer_stop,      METH_NOARGS,  "Stop server"},
     {"match_route", (PyCFunction)CatzillaServer_match_route, METH_VARARGS, "Match route using C router"},
     {"add_c_route", (PyCFunction)CatzillaServer_add_c_route, METH_VARARGS, "Add route to C router"},
@@ -2503,6 +2544,13 @@ PyMODINIT_FUNC PyInit__catzilla(void)
 
     PyModule_AddStringConstant(m, "VERSION", "0.1.0");
 
+    // Tells Python which variable jemalloc reads its options from:
+    // JE_MALLOC_CONF for a je_-prefixed build, MALLOC_CONF otherwise
+#ifndef CATZILLA_JEMALLOC_USES_PREFIX
+#define CATZILLA_JEMALLOC_USES_PREFIX 0
+#endif
+    PyModule_AddIntConstant(m, "JEMALLOC_USES_PREFIX", CATZILLA_JEMALLOC_USES_PREFIX);
+
     // Initialize middleware registry
     if (init_middleware_registry() < 0) {
         Py_DECREF(m);
@@ -225,6 +225,31 @@ class TestRouteIntrospection:
         assert "get_user" in handler_names
         assert "create_user" in handler_names
 
+    def test_response_normalizer_from_annotation(self):
+        """Test that the result normalizer is picked from the return annotation"""
+        router = CAcceleratedRouter()
+
+        def as_dict(request) -> dict:
+            return {"ok": True}
+
+        def as_text(request) -> str:
+            return "<p>ok</p>"
+
+        def unannotated(request):
+            return {"ok": True}
+
+        dict_route = router.add_route("GET", "/dict", as_dict)
+        text_route = router.add_route("GET", "/text", as_text)
+        plain_route = router.add_route("GET", "/plain", unannotated)
+
+        assert dict_route.response_normalizer({"ok": True}).content_type == "application/json"
+        assert text_route.response_normalizer("<p>ok</p>").content_type == "text/html"
+        # A handler that returns something other than it declares still works
+        assert dict_route.response_normalizer("<p>ok</p>").content_type == "text/html"
+        assert plain_route.response_normalizer({"ok": True}).status_code == 200
+        with pytest.raises(TypeError):
+            plain_route.response_normalizer(42)
+
 
 class TestRouteDecorators:
     """Test route decorator methods"""
@@ -315,6 +340,30 @@ class TestAppIntegration:
             def api_version_duplicate(request):
                 return {}
 
+    def test_auto_validation_skips_plain_handlers(self):
+        """Test that handlers without validated parameters are left unwrapped"""
+        import functools
+        from catzilla.auto_validation import create_auto_validated_handler
+
+        def index(request: Request) -> dict:
+            return {}
+
+        @functools.wraps(index)
+        def decorated(*args, **kwargs):
+            return index(*args, **kwargs)
+
+        def search(request, q: str = Query("")):
+            return {"q": q}
+
+        def marker_only(request, q=Query("")):
+            return {"q": q}
+
+        assert create_auto_validated_handler(index) is index
+        assert create_auto_validated_handler(decorated) is decorated
+        assert create_auto_validated_handler(search) is not search
+        # Markers are honoured even without an annotation
+        assert create_auto_validated_handler(marker_only) is not marker_only
+
 
 class TestErrorHandling:
     """Test error handling and edge cases"""
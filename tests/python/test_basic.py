@@ -14,6 +14,7 @@ import pytest
 import asyncio
 import time
 import os
+import sys
 from catzilla import Request, Response, JSONResponse, HTMLResponse, Catzilla, BaseModel
 from typing import Optional
 
@@ -91,6 +92,17 @@ def test_response_cookies():
     assert "HttpOnly" in cookie_header
 
 
+def test_response_slots():
+    """Test that responses use slots and create the cookie jar lazily"""
+    for resp in (Response(), JSONResponse({"ok": True}), HTMLResponse("<p>ok</p>")):
+        assert not hasattr(resp, "__dict__")
+        assert resp._cookies is None
+
+    resp = Response()
+    resp.set_cookie("session", "abc123")
+    assert resp._cookies is not None
+
+
 def test_handler_return_types():
     """Test different return types from handlers with modern Catzilla"""
     app = Catzilla(production=True)
@@ -295,6 +307,60 @@ def test_memory_revolution_features():
     assert hasattr(app, 'has_jemalloc') or True  # May not be available in all test environments
 
 
+@pytest.mark.parametrize("env_name", ["MALLOC_CONF", "JE_MALLOC_CONF"])
+def test_jemalloc_conf_export(monkeypatch, env_name):
+    """Test MALLOC_CONF defaults, user overrides and extra_malloc_conf"""
+    import catzilla.app as app_module
+
+    other_name = "JE_MALLOC_CONF" if env_name == "MALLOC_CONF" else "MALLOC_CONF"
+    # The variable follows the jemalloc symbol prefix detected at build time
+    monkeypatch.setattr(app_module, "_MALLOC_CONF_ENV", env_name)
+    monkeypatch.delenv("MALLOC_CONF", raising=False)
+    monkeypatch.delenv("JE_MALLOC_CONF", raising=False)
+    app = Catzilla(use_jemalloc=False, extra_malloc_conf="hpa:true")
+
+    app._configure_jemalloc()
+    app._configure_jemalloc()  # Idempotent
+
+    conf = os.environ[env_name]
+    assert conf.endswith("dirty_decay_ms:30000,muzzy_decay_ms:30000,hpa:true")
+    assert conf.startswith("percpu_arena:percpu") == sys.platform.startswith("linux")
+    assert other_name not in os.environ
+
+    # A user-supplied value is kept and extended
+    monkeypatch.setenv(env_name, "narenas:2")
+    app._configure_jemalloc()
+    assert os.environ[env_name] == "narenas:2,hpa:true"
+
+
+def test_jemalloc_conf_env_matches_build_prefix():
+    """Test the exported variable is the one the built jemalloc reads"""
+    import catzilla.app as app_module
+    from catzilla._catzilla import JEMALLOC_USES_PREFIX
+
+    expected = "JE_MALLOC_CONF" if JEMALLOC_USES_PREFIX else "MALLOC_CONF"
+    assert app_module._MALLOC_CONF_ENV == expected
+
+
+def test_production_error_responses_are_reused():
+    """Test that production error responses are built once and shared"""
+    app = Catzilla(production=True)
+
+    not_found = app._get_clean_error_response(404, "Not found")
+    assert app._get_clean_error_response(404, "Not found") is not_found
+    assert not_found.status_code == 404
+    assert not_found.body == '{"error": "Not found"}'
+
+    # Detail is never exposed in production
+    not_allowed = app._get_clean_error_response(405, "Method not allowed", "GET")
+    assert not_allowed.body == '{"error": "Method not allowed"}'
+
+    dev_app = Catzilla(production=False)
+    dev_resp = dev_app._get_clean_error_response(404, "Not found", "missing")
+    assert dev_resp is not dev_app._get_clean_error_response(404, "Not found")
+    assert "missing" in dev_resp.body
+
+
 def test_performance_optimized_responses():
     """Test performance optimized response handling"""
     app = Catzilla(auto_validation=True, production=True)
@@ -39,6 +39,9 @@ class TestHTTPResponseCodes:
         assert route is None  # No route for PUT
         # HEAD is automatically supported for GET routes
         assert allowed_methods == {"GET", "HEAD", "POST"}  # But these methods are allowed
+        # The sorted Allow header is cached and shared across 405 matches
+        assert allowed_methods.allow_header == "GET, HEAD, POST"
+        assert app.router.match("DELETE", "/api/data")[2] is allowed_methods
 
     def test_404_not_found(self):
         """Test 404 Not Found responses"""
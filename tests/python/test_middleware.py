@@ -143,6 +143,116 @@ class TestMiddlewareExecution:
         # Should execute in priority order: 100, 200, 300
         assert self.execution_order == ["first", "second", "third"]
 
+    def test_middleware_chains_sorted_at_registration(self):
+        """Test that pre/post-route chains are pre-sorted when middleware registers"""
+
+        @self.app.middleware(priority=300, name="late")
+        def late_middleware(request):
+            return None
+
+        @self.app.middleware(priority=100, name="early")
+        def early_middleware(request):
+            return None
+
+        @self.app.middleware(priority=200, pre_route=False, post_route=True, name="timer")
+        def timer_middleware(request, response):
+            return None
+
+        assert isinstance(self.app._pre_route_chain, tuple)
+        assert [m['name'] for m in self.app._pre_route_chain] == ["early", "late"]
+        assert [m['name'] for m in self.app._post_route_chain] == ["timer"]
+        assert self.app._post_route_chain[0]['accepts_response'] is True
+
+    def test_middleware_skip_paths(self):
+        """Test that skip_paths is stored as a frozenset on registration"""
+
+        @self.app.middleware(priority=100, name="skipper", skip_paths=["/health", "/metrics"])
+        def skipper_middleware(request):
+            return None
+
+        @self.app.middleware(priority=200, name="always")
+        def always_middleware(request):
+            return None
+
+        skipper, always = self.app._pre_route_chain
+        assert skipper['skip_paths'] == frozenset({"/health", "/metrics"})
+        assert always['skip_paths'] == frozenset()
+
+    def test_async_middleware_detected_at_registration(self):
+        """Test that async middleware is classified once when registered"""
+
+        @self.app.middleware(priority=100, name="async_mw")
+        async def async_mw(request):
+            return None
+
+        @self.app.middleware(priority=200, name="sync_mw")
+        def sync_mw(request):
+            return None
+
+        async_info, sync_info = self.app._pre_route_chain
+        assert async_info['is_async'] is True
+        assert sync_info['is_async'] is False
+
+    def test_async_middleware_runs_and_short_circuits(self):
+        """Test that async global and per-route middleware are awaited in dispatch"""
+        calls = []
+
+        @self.app.middleware(priority=100, name="async_global")
+        async def async_global(request):
+            await asyncio.sleep(0)
+            calls.append("global")
+            return None
+
+        async def async_guard(request):
+            await asyncio.sleep(0)
+            calls.append("guard")
+            return JSONResponse({"error": "blocked"}, status_code=401)
+
+        @self.app.get("/async-guarded", middleware=[async_guard])
+        def guarded(request):
+            calls.append("handler")
+            return JSONResponse({"data": "secret"})
+
+        with patch("catzilla._catzilla.send_response") as send:
+            self.app._handle_request(None, "GET", "/async-guarded", "", None)
+
+        assert calls == ["global", "guard"]
+        _, status, _, body = send.call_args[0]
+        assert status == 401
+        assert json.loads(body) == {"error": "blocked"}
+
+    def test_compiled_global_dispatch(self):
+        """Test the generated pre/post-route dispatch functions"""
+        calls = []
+
+        @self.app.middleware(priority=100, name="first", skip_paths=["/health"])
+        def first(request):
+            calls.append("first")
+            return None
+
+        @self.app.middleware(priority=200, name="blocker")
+        def blocker(request):
+            calls.append("blocker")
+            return JSONResponse({"error": "blocked"}, status_code=403)
+
+        @self.app.middleware(priority=300, name="never")
+        def never(request):
+            calls.append("never")
+            return None
+
+        @self.app.middleware(pre_route=False, post_route=True, name="replacer")
+        def replacer(request, response):
+            return JSONResponse({"replaced": True}, status_code=201)
+
+        result = self.app._pre_route_dispatch(Mock(), "/health")
+        assert result.status_code == 403
+        assert calls == ["blocker"]
+
+        original = JSONResponse({"original": True})
+        final = self.app._post_route_dispatch(Mock(), original, "/")
+        assert final is not original
+        assert final.status_code == 201
+
     def test_middleware_with_request_modification(self):
         """Test middleware that modifies request"""
         request_modifications = []
@@ -299,6 +299,39 @@ class TestMiddlewareShortCircuiting:
         assert "second" in middleware_names
         assert "third" in middleware_names
 
+    def test_compiled_middleware_chain_short_circuits(self):
+        """Test that the compiled per-route chain stops at the first response"""
+        def allow(request):
+            self.middleware_calls.append("allow")
+            return None
+
+        def block(request):
+            self.middleware_calls.append("block")
+            return JSONResponse({"error": "blocked"}, status_code=401)
+
+        def never(request):
+            self.middleware_calls.append("never")
+            return None
+
+        @self.app.get("/chain", middleware=[allow, block, never])
+        def chain_handler(request):
+            return JSONResponse({"protected": "data"})
+
+        test_route = next(r for r in self.app.router._routes if r.path == "/chain")
+        result = test_route.middleware_chain(Mock())
+
+        assert result.status_code == 401
+        assert self.middleware_calls == ["allow", "block"]
+
+    def test_route_without_middleware_has_no_chain(self):
+        """Test that routes without middleware skip chain compilation"""
+        @self.app.get("/plain")
+        def plain_handler(request):
+            return JSONResponse({"plain": True})
+
+        test_route = next(r for r in self.app.router._routes if r.path == "/plain")
+        assert test_route.middleware_chain is None
+
 
 class TestPerRouteMiddlewareTypes:
     """Test different types of middleware functionality"""
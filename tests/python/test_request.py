@@ -237,6 +237,55 @@ def test_headers_normalization():
     assert request.headers["x-custom-header"] == "value"
 
 
+def test_context_initialized():
+    """
+    Test request context initialization:
+    - Verify context is an empty dict on a fresh request
+    - Check each request gets its own context
+    """
+    request = Request(
+        method="GET",
+        path="/test",
+        body="",
+        client=None,
+        request_capsule=None,
+        _query_params={}
+    )
+    other = Request(
+        method="GET",
+        path="/test",
+        body="",
+        client=None,
+        request_capsule=None,
+        _query_params={}
+    )
+    assert request.context == {}
+    request.context["user"] = "user123"
+    assert other.context == {}
+
+
+def test_positional_construction():
+    """
+    Test positional request construction as used by the dispatcher:
+    - Verify headers default to an empty dict
+    - Check query params are only allocated on first access
+    - Check defaults are not shared between requests
+    """
+    request = Request("GET", "/test?a=1", "", None, None)
+    other = Request("GET", "/test", "", None, None)
+    assert request.path == "/test?a=1"
+    assert request.headers == {}
+    assert request._query_params is None
+
+    # Query params are always a real, per-request dict
+    assert isinstance(other.query_params, dict)
+    assert other.query_params == {}
+    assert other.query_params is not Request("GET", "/", "", None, None).query_params
+
+    request.query_params = None
+    assert request.query_params == {}
+
+
 def test_text_method():
     """
     Test text body access method: